@@ -13,7 +13,9 @@ warnings.filterwarnings("ignore")       # ignore warnings from pandas
 
 from pathlib import Path
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Literal, Optional, get_args
+import numpy as np
 import pandas as pd
 from time import sleep
 from tqdm import tqdm
@@ -31,7 +33,8 @@ STANDALONE_PARAMS = {
     "url": 'https://trac.syr.edu/phptools/immigration/cbparrest/',
     "filename": 'cbparrestschrome.hdf',
     "axes": ['Gender', 'Special Initiatives', 'Marital Status'],
-    "headless": True
+    "headless": True,
+    "workers": 1
 }
 
 USAGE = (
@@ -44,6 +47,8 @@ USAGE = (
     f"\t--browser=<n>\tName of the browser to use. Valid names are \n"
     f"\t\t\t'Firefox', 'Chrome', 'Edge', and 'Safari'.\n"
     f"\t[--headless]\tUse the browser in headless mode.\n"
+    f"\t[--workers=<n>]\tNumber of browser instances to collate with in \n"
+    f"\t\t\tparallel. Defaults to 1.\n"
     f"\t[-h, --help]\tShow this screen.\n\n"
     f"Arguments:\n"
     f"\turl\tFull address of the TRAC webpage.\n"
@@ -83,8 +88,166 @@ PARTIALLY_SUPPORTED_TYPES = ['object-broken', 'link-broken']
 
 TIMEOUT = 10
 
+# Interval (ms) at which the browser polls a table while waiting for it to
+# finish re-rendering
+STABLE_POLL_INTERVAL = 50
+
+# Time (ms) after which a table whose contents have not changed is accepted as
+# is, since a click can legitimately produce an identical table
+STABLE_SETTLE_TIME = 500
+
 SUPPORTED_BROWSERS = Literal['Firefox', 'Chrome', 'Edge', 'Safari']
 
+# Defines normalize(), which collapses whitespace in visible text the same way
+# for every script below, so that names read from rows and options match
+NORMALIZE_TEXT_SCRIPT = """
+const normalize = (text) => text.replace(/\\s+/g, ' ').trim();
+"""
+
+# Returns the text, name, value, element, and clickable element of every 
+# meaningful row in a table (i.e., not empty and not a header or total row).
+# The name and value are split from the text in the browser, and the value has
+# its thousands separators removed. If the text does not end in a number, the
+# value is null and the name is the text without its last word.
+# Arguments: table element, row selector, clickable selector (or null if the
+# row element is itself clickable), text only flag (if true, elements are not
+# returned)
+EXTRACT_ROWS_SCRIPT = NORMALIZE_TEXT_SCRIPT + """
+const [table, rowSelector, clickableSelector, textOnly] = arguments;
+const notMeaningful = /All|Total/;
+const rows = [];
+table.querySelectorAll(rowSelector).forEach((row, i) => {
+    const text = normalize(row.innerText);
+    if (text === '' || notMeaningful.test(text)) {
+        return;
+    }
+    const match = text.match(/^(.*) ([\\d,]+)$/);
+    const r = {
+        index: i,
+        text: text,
+        name: match ? match[1] : text.replace(/ [^ ]*$/, ''),
+        value: match ? match[2].replace(/,/g, '') : null
+    };
+    if (!textOnly) {
+        r.element = row;
+        r.clickable = clickableSelector ? row.querySelector(clickableSelector) : row;
+    }
+    rows.push(r);
+});
+return rows;
+"""
+
+# Returns the name of the selected option of an axis menu, which is either a
+# <select> element (link) or a listbox button (object).
+# Arguments: menu element
+CURRENT_OPTION_SCRIPT = NORMALIZE_TEXT_SCRIPT + """
+const menu = arguments[0];
+if (menu.tagName === 'SELECT') {
+    return menu.selectedIndex < 0 ? null : 
+        normalize(menu.options[menu.selectedIndex].text);
+}
+return normalize(menu.innerText);
+"""
+
+# Returns the names (visible text) of the options of an axis menu.
+# Arguments: list of option elements
+OPTION_NAMES_SCRIPT = NORMALIZE_TEXT_SCRIPT + """
+return arguments[0].map(
+    e => normalize(e.tagName === 'OPTION' ? e.text : e.innerText)
+);
+"""
+
+# Sets the axis menus (<select> elements) of a link webpage to the given
+# option names. All values are set before any change events are dispatched,
+# so every event handler sees the final selection. Returns the names that
+# could not be found.
+# Arguments: list of option names (one per menu, from left to right)
+SET_ALL_AXES_SCRIPT = NORMALIZE_TEXT_SCRIPT + """
+const axes = arguments[0];
+const menus = document.querySelectorAll("select[id^='dimension_pick']");
+const missing = [];
+axes.forEach((name, i) => {
+    const index = Array.from(menus[i].options).findIndex(
+        o => normalize(o.text) === name
+    );
+    if (index < 0) {
+        missing.push(name);
+    } else {
+        menus[i].selectedIndex = index;
+    }
+});
+if (missing.length === 0) {
+    axes.forEach((name, i) => {
+        menus[i].dispatchEvent(new Event('change', {bubbles: true}));
+    });
+}
+return missing;
+"""
+
+# Starts watching a table for re-rendering. A MutationObserver on the table
+# records any change to its rows or text, and a table that has been detached
+# from the document (i.e., replaced) also counts as changed. Attribute changes
+# (e.g., a loading class) do not count, since the old rows are still shown.
+# Arguments: table selector, table index
+WATCH_TABLE_SCRIPT = """
+const [tableSelector, tableIndex] = arguments;
+const key = tableSelector + '|' + tableIndex;
+window.__tracTableWatchers = window.__tracTableWatchers || {};
+const previous = window.__tracTableWatchers[key];
+if (previous && previous.observer) {
+    previous.observer.disconnect();
+}
+const table = document.querySelectorAll(tableSelector)[tableIndex];
+const watcher = {table: table || null, changed: !table, observer: null};
+if (table) {
+    watcher.observer = new MutationObserver(() => { watcher.changed = true; });
+    watcher.observer.observe(table, {
+        childList: true, subtree: true, characterData: true
+    });
+}
+window.__tracTableWatchers[key] = watcher;
+"""
+
+# Waits (asynchronously, inside the browser) until a table watched with
+# WATCH_TABLE_SCRIPT has rows and its text has stopped changing. The table must
+# also have changed, unless it stays unchanged for the settle time (identical
+# tables do occur). Returns true once the table is stable, or false if the
+# timeout is reached first. A table that is not being watched only has to have
+# stable text.
+# Arguments: table selector, table index, row selector, poll interval (ms),
+# settle time (ms), timeout (ms), callback
+WAIT_STABLE_SCRIPT = """
+const [tableSelector, tableIndex, rowSelector, interval, settle, timeout] = arguments;
+const callback = arguments[arguments.length - 1];
+const key = tableSelector + '|' + tableIndex;
+const watchers = window.__tracTableWatchers || {};
+const watcher = watchers[key];
+const start = Date.now();
+let last = null;
+const finish = (result) => {
+    clearInterval(poll);
+    if (watcher && watcher.observer) {
+        watcher.observer.disconnect();
+    }
+    delete watchers[key];
+    callback(result);
+};
+const poll = setInterval(() => {
+    const elapsed = Date.now() - start;
+    const table = document.querySelectorAll(tableSelector)[tableIndex];
+    const text = table ? table.innerText : null;
+    const hasRows = table ? table.querySelector(rowSelector) !== null : false;
+    const changed = !watcher || watcher.changed || 
+                    (watcher.table !== null && !watcher.table.isConnected);
+    if (hasRows && text === last && (changed || elapsed >= settle)) {
+        finish(true);
+    } else if (elapsed >= timeout) {
+        finish(false);
+    }
+    last = text;
+}, interval);
+"""
+
 ## Classes
 class Table:
     """
@@ -97,16 +260,24 @@ class Table:
         table_type: A string representing the kind of table element this Table 
                     is for. This string is used to determine how to poll the DOM
                     for table rows and other important elements.
+        wait: Optional WebDriverWait for `driver`, shared with other objects
+              that access the same webpage. If not given, one is created.
     """
-    def __init__(self, driver, table_index: int, table_type: Literal['object', 'link']):
+    def __init__(self, driver, table_index: int, table_type: Literal['object', 'link'],
+                 wait: Optional[WebDriverWait] = None):
         # Set initial instance attributes
         self.driver = driver
         self.table_index = table_index
         self.table_type = table_type
+        self.wait = wait if wait is not None else WebDriverWait(driver, TIMEOUT)
        
         # Set private/container instance attributes
         self._web_element = None
+        self._element_wait = None
         self._text_rows = []
+        self._row_names = []
+        self._raw_row_values = []
+        self._row_values = None
         self._rows = []
         
         # Set instance table query attribute based on the table type
@@ -114,18 +285,25 @@ class Table:
             self.table_query = (By.CLASS_NAME, 'table-fixed')
         elif table_type == 'link':
             self.table_query = (By.CLASS_NAME, 'Table')
+        self.table_selector = '.' + self.table_query[1]
 
-        # Set instance row query attribute based on the table type
+        # Set instance row CSS selector attributes based on the table type
+        # Note: CSS selectors are used rather than XPath because they are
+        #       faster to evaluate, and they can also be used directly in the
+        #       batched JavaScript extraction of rows
         if self.table_type == 'object':
-            self.row_query = (By.CLASS_NAME, 'flex-row')
+            self.row_selector = '.flex-row'
+            self.row_clickable_selector = None #because rows are already clickable
         elif self.table_type == 'link':
-            self.row_query = (By.XPATH, ".//tr")
+            self.row_selector = 'tr'
+            self.row_clickable_selector = 'td.Data.l > a'
 
-        # Set instance row clickable element query attribute based on table type
-        if self.table_type == 'object':
-            self.row_clickable_query = None #because row_query is already clickable
-        elif self.table_type == 'link':
-            self.row_clickable_query = (By.XPATH, ".//td[@class='Data l']/a")
+        # Set instance row query attributes based on the CSS selectors
+        self.row_query = (By.CSS_SELECTOR, self.row_selector)
+        if self.row_clickable_selector == None:
+            self.row_clickable_query = None
+        else:
+            self.row_clickable_query = (By.CSS_SELECTOR, self.row_clickable_selector)
 
     @property
     def text_rows(self):
@@ -134,51 +312,137 @@ class Table:
         leading and trailing whitespace, and without headers.
         """
         if self._text_rows == []:
-            # Get text, filter for meaninful rows
-            def is_meaningful(text):
-                return (text != '' and 'All' not in text and 'Total' not in text)
-            try:
-                self._text_rows = self.web_element.text.split('\n')
-            except StaleElementReferenceException:
-                self.recalculate_web_element()
-                self._text_rows = self.web_element.text.split('\n')
-            self._text_rows = [r for r in self._text_rows if is_meaningful(r)]
+            self.calculate_rows()
         return self._text_rows
     
+    @property
+    def row_names(self):
+        """List of the names of text_rows (the text in the left column)."""
+        if self._text_rows == []:
+            self.calculate_rows()
+        return self._row_names
+    
+    @property
+    def row_values(self):
+        """
+        NumPy array of the integer values of text_rows. Values are converted
+        in a single NumPy call the first time they are needed.
+        """
+        if self._text_rows == []:
+            self.calculate_rows()
+        if self._row_values is None:
+            for text, value in zip(self._text_rows, self._raw_row_values):
+                if value is None:
+                    msg = f"Row '{text}' in table {self.table_index + 1} does "
+                    msg += "not end with a numeric value"
+                    raise ValueError(msg)
+            self._row_values = np.array(self._raw_row_values, dtype=np.int64)
+        return self._row_values
+    
     def recalculate_text_rows(self):
-        self._text_rows = []
-        self._text_rows = self.text_rows
+        """
+        Recalculate only text_rows for this Table. Existing Row objects are
+        discarded because their web elements may no longer match the text.
+        """
+        self._rows = []
+        self.calculate_text_rows()
     
     @property
     def rows(self):
         """
         List of Row objects for this Table, of the same length as text_rows.
         """
-        # Calculate rows if necessary
         if self._rows == []:
-            # In object-type tables, text_rows are currently offset by 4 
-            # (1-3 are empty, 4 is header) (NOTE: this could change)
-            if self.table_type == 'object':
-                self._rows = [Row(self, i+4, self.row_query) for i in range(len(self.text_rows))]
-            
-            # In link-type tables, text_rows are currently offset by 2 (header) 
-            # (NOTE: this could change)
-            elif self.table_type == 'link':
-                self._rows = [Row(self, i+2, self.row_query) for i in range(len(self.text_rows))]
-
-            # I don't understand why, but sometimes the lengths of text_rows
-            # and rows are different. This makes sure they are the same.
-            #       TODO: come up with a better fix
-            if len(self._rows) > len(self.text_rows):
-                for i in range(len(self._rows) - len(self.text_rows)):
-                    _ = self._rows.pop(-1)
-            
+            self.calculate_rows()
         return self._rows
     
     def recalculate_rows(self):
+        """Recalculate rows (and text_rows) for this Table."""
         self._rows = []
         self._rows = self.rows  # better way to use setter?
 
+    def calculate_rows(self):
+        """
+        Calculate text_rows and Row objects for this Table from a single
+        batched extraction of the DOM (see `_extract_rows_js`), so that no
+        further WebDriver calls are needed to name or click each Row.
+        """
+        extracted_rows = self._extract_rows_js()
+        self._set_text_rows(extracted_rows)
+        self._rows = [
+            Row(self, r['index'], self.row_query, 
+                web_element=r['element'], 
+                clickable_web_element=r['clickable'],
+                name=r['name'])
+            for r in extracted_rows
+        ]
+
+    def calculate_text_rows(self):
+        """
+        Calculate text_rows for this Table without creating Row objects. This
+        is cheaper than `calculate_rows` because no web element references
+        have to be returned from the browser.
+        """
+        extracted_rows = self._extract_rows_js(text_only=True)
+        self._set_text_rows(extracted_rows)
+
+    def _set_text_rows(self, extracted_rows: list[dict]):
+        """
+        Set text_rows, row_names, and (unconverted) row_values from extracted
+        rows.
+        """
+        self._text_rows = [r['text'] for r in extracted_rows]
+        self._row_names = [r['name'] for r in extracted_rows]
+        self._raw_row_values = [r['value'] for r in extracted_rows]
+        self._row_values = None
+
+    def _extract_rows_js(self, text_only: bool = False):
+        """
+        Extract the text, name, value, web element, and clickable web element
+        of every meaningful row in this Table with one call to `driver.execute_script`, 
+        instead of one WebDriver round-trip per row. If `text_only` is True, 
+        web elements are not returned.
+        """
+        args = (self.row_selector, self.row_clickable_selector, text_only)
+        try:
+            return self.driver.execute_script(
+                EXTRACT_ROWS_SCRIPT, self.web_element, *args
+            )
+        except StaleElementReferenceException:
+            self.recalculate_web_element()
+            return self.driver.execute_script(
+                EXTRACT_ROWS_SCRIPT, self.web_element, *args
+            )
+
+    def watch_for_change(self):
+        """
+        Start watching this Table for re-rendering. This must be called before
+        the click (or other action) that re-renders the Table, and followed by
+        `wait_stable`.
+        """
+        self.driver.execute_script(WATCH_TABLE_SCRIPT, self.table_selector, 
+                                   self.table_index)
+
+    def wait_stable(self):
+        """
+        Wait until this Table has re-rendered since `watch_for_change` was 
+        called and its rows have stopped changing. A Table whose rows stay the
+        same for STABLE_SETTLE_TIME is accepted as is. The polling is done 
+        inside the browser, so this takes a single WebDriver call.
+
+        Raises TimeoutException if the Table has no stable rows in time, so 
+        that a half-rendered Table is never read.
+        """
+        stable = self.driver.execute_async_script(
+            WAIT_STABLE_SCRIPT, self.table_selector, self.table_index, 
+            self.row_selector, STABLE_POLL_INTERVAL, STABLE_SETTLE_TIME, 
+            TIMEOUT * 1000
+        )
+        if not stable:
+            msg = f"Table {self.table_index + 1} did not re-render within "
+            msg += f"{TIMEOUT} seconds."
+            raise TimeoutException(msg)
+
     def calculate_all_row_web_elements(self):
         """
         Calculate web elements for all Row objects in this Table, and assign 
@@ -194,8 +458,7 @@ class Table:
             self.recalculate_rows()
       
         # Calculate all row elements
-        wait = WebDriverWait(self.web_element, TIMEOUT)
-        new_row_web_elements = wait.until(EC.presence_of_all_elements_located(self.row_query))
+        new_row_web_elements = self.element_wait.until(EC.presence_of_all_elements_located(self.row_query))
 
         # Re-assign row elements
         for r in self._rows:
@@ -224,8 +487,7 @@ class Table:
         
         else:
             # Calculate all clickable row elements
-            wait = WebDriverWait(self.web_element, TIMEOUT)
-            new_row_clickable_web_elements = wait.until(EC.presence_of_all_elements_located(self.row_clickable_query))
+            new_row_clickable_web_elements = self.element_wait.until(EC.presence_of_all_elements_located(self.row_clickable_query))
 
             # Re-assign clickable row elements
             for r in self._rows:        #TODO: self._rows or self.rows???
@@ -237,20 +499,29 @@ class Table:
         Web element for this Table, automatically calculated if necessary.
         """
         if self._web_element == None:
-            self._web_element = self.get_web_element(self.driver)
+            self._web_element = self.get_web_element()
         return self._web_element
     
-    def get_web_element(self, driver, fail_cap: int = -1):
+    @property
+    def element_wait(self):
+        """
+        WebDriverWait for polling inside this Table's web element, created
+        once per web element.
+        """
+        if self._element_wait == None:
+            self._element_wait = WebDriverWait(self.web_element, TIMEOUT)
+        return self._element_wait
+    
+    def get_web_element(self, fail_cap: int = -1):
         """
         Find the web element for this Table. By default, the driver will keep 
         polling the DOM indefinitely until it finds the table. Set `fail_cap`
         to a positive value to limit the number of times the DOM can be polled.
         """
-        wait = WebDriverWait(driver, TIMEOUT)
         fail_count = 0
         while fail_count < fail_cap or fail_cap < 0:
             try:
-                table_elements = wait.until(EC.presence_of_all_elements_located(self.table_query))
+                table_elements = self.wait.until(EC.presence_of_all_elements_located(self.table_query))
             except TimeoutException:
                 print(f'Warning: table not found. Trying again... ({fail_count = })')
                 fail_count += 1
@@ -260,6 +531,7 @@ class Table:
     
     def recalculate_web_element(self):
         self._web_element = None
+        self._element_wait = None
         self._web_element = self.web_element    # better way to use setter?
 
 class Row:
@@ -272,17 +544,23 @@ class Row:
                    corresponds to. Index order is ascending from top to bottom.
         query: A tuple representing the query to use when polling the DOM for
                this row's web element. Example: `(By.CLASS_NAME, 'table-fixed')`
+        web_element: Optional pre-calculated web element for this Row.
+        clickable_web_element: Optional pre-calculated clickable web element
+                               for this Row.
+        name: Optional pre-calculated name for this Row.
     """
-    def __init__(self, parent_table: Table, row_index: int, query: tuple):
+    def __init__(self, parent_table: Table, row_index: int, query: tuple,
+                 web_element=None, clickable_web_element=None, 
+                 name: Optional[str] = None):
         # Set initial instance attributes
         self.parent_table = parent_table
         self.row_index = row_index
         self.query = query
 
         # Set private/container instance attributes
-        self._web_element = None
-        self._clickable_web_element = None
-        self._name = None
+        self._web_element = web_element
+        self._clickable_web_element = clickable_web_element
+        self._name = name
 
     @property
     def web_element(self):
@@ -307,8 +585,9 @@ class Row:
         fail_count = 0
         while fail_count < fail_cap or fail_cap < 0:
             try:
-                wait = WebDriverWait(self.parent_table.web_element, TIMEOUT)
-                elements = wait.until(EC.presence_of_all_elements_located(self.query))
+                elements = self.parent_table.element_wait.until(
+                    EC.presence_of_all_elements_located(self.query)
+                )
             except (TimeoutException, NoSuchElementException) as e:
                 print(f'Warning: {type(e)} was encountered - row could not be found. Trying again... ({fail_count = })')
                 if recalculate_table_element:
@@ -334,7 +613,7 @@ class Row:
                 wait = WebDriverWait(self.web_element, TIMEOUT)
                 self._clickable_web_element = wait.until(
                     EC.presence_of_element_located(
-                        (By.XPATH, ".//td[@class='Data l']/a")
+                        self.parent_table.row_clickable_query
                     )
                 )
         
@@ -355,7 +634,11 @@ class Row:
     def name(self):
         """Name of this Row, corresponding to the text in the left column."""
         if self._name == None:
-            self._name = self.web_element.text.rsplit(' ', 1)[0]
+            text = self.parent_table.driver.execute_script(
+                NORMALIZE_TEXT_SCRIPT + "return normalize(arguments[0].innerText);",
+                self.web_element
+            )
+            self._name = text.rsplit(' ', 1)[0]
         return self._name
     
     def recalculate_name(self):
@@ -371,28 +654,32 @@ class AxisMenu:
         webpage_type: A string representing the type of the webpage.
         axis_index: An integer indicating which menu on the webpage this 
                     AxisMenu is for (0 = left, 1 = middle, 2 = right).
+        wait: Optional WebDriverWait for `driver`, shared with other objects
+              that access the same webpage. If not given, one is created.
     """
-    def __init__(self, driver, webpage_type: str, axis_index: int):
+    def __init__(self, driver, webpage_type: str, axis_index: int, 
+                 wait: Optional[WebDriverWait] = None):
         # Set instance attributes
         self.driver = driver
         self.webpage_type = webpage_type
+        self.wait = wait if wait is not None else WebDriverWait(driver, TIMEOUT)
 
         # Calculate menus
-        wait = WebDriverWait(driver, TIMEOUT)
         #TODO: account for object-broken and link-broken
         if 'object' in webpage_type:
-            menus = wait.until(
+            menus = self.wait.until(
                 EC.presence_of_all_elements_located(
-                    (By.XPATH, "//button[starts-with(@id, 'headlessui-listbox-button')]")
+                    (By.CSS_SELECTOR, "button[id^='headlessui-listbox-button']")
                 )
             )
         elif 'link' in webpage_type:
-            menus = wait.until(
+            menus = self.wait.until(
                 EC.presence_of_all_elements_located(
-                    (By.XPATH, "//select[starts-with(@id, 'dimension_pick')]")
+                    (By.CSS_SELECTOR, "select[id^='dimension_pick']")
                 )
             )
         self.clickable_element = menus[axis_index]
+        self._element_wait = WebDriverWait(self.clickable_element, TIMEOUT)
 
         # Calculate options
         # Note: Chrome and Edge can encounter stale element references when 
@@ -406,6 +693,26 @@ class AxisMenu:
             else:
                 break
 
+        # Calculate the currently selected option
+        self._current = self.calculate_current()
+
+    @property
+    def current(self):
+        """Name of the option that is currently selected."""
+        return self._current
+
+    def record_selection(self, axis_name: str):
+        """
+        Record that the option `axis_name` has been selected. This does not 
+        select it; use `set_to` for that.
+        """
+        self._current = axis_name
+
+    def calculate_current(self):
+        """Return the name of the option that is currently selected."""
+        return self.driver.execute_script(CURRENT_OPTION_SCRIPT, 
+                                          self.clickable_element)
+
     def calculate_options(self):
         """
         Find all of the options in this AxisMenu and store them in self.options.
@@ -415,31 +722,42 @@ class AxisMenu:
             # are inside it. The clickable element must be clicked before
             # the listbox will appear.
             self.click()
-            wait = WebDriverWait(self.driver, TIMEOUT)
-            listbox_element = wait.until(EC.presence_of_element_located(
-                (By.XPATH, "//ul[starts-with(@id, 'headlessui-listbox-options')]")
+            listbox_element = self.wait.until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, "ul[id^='headlessui-listbox-options']")
             ))
 
             wait = WebDriverWait(listbox_element, TIMEOUT)
             option_elements = wait.until(
                 EC.presence_of_all_elements_located(
-                    (By.XPATH, ".//*[@role='option']/li/span")
+                    (By.CSS_SELECTOR, "[role='option'] > li > span")
                 )
             )
 
         elif 'link' in self.webpage_type:
             # options are inside the clickable element
-            wait = WebDriverWait(self.clickable_element, TIMEOUT)
-            option_elements = wait.until(EC.presence_of_all_elements_located(
-                    (By.XPATH, f".//option")
+            option_elements = self._element_wait.until(EC.presence_of_all_elements_located(
+                    (By.CSS_SELECTOR, "option")
             ))
-        self.options = [Option(e) for e in option_elements]
+        # Note: names are read for all options with a single script call, 
+        #       which raises StaleElementReferenceException if any are stale
+        option_names = self.driver.execute_script(OPTION_NAMES_SCRIPT, 
+                                                  option_elements)
+        self.options = [Option(e, n) for e, n in zip(option_elements, option_names)]
+        self._options_by_name = {o.name: o for o in self.options}
 
     def click(self):
         self.clickable_element.click()
 
     def set_to(self, axis_name: str):
         """Set the axis for this AxisMenu to one of its Options."""
+        # Skip selection if the option is already selected. An object-based
+        # listbox may still be open from calculate_options, so close it first
+        if axis_name == self.current:
+            if ('object' in self.webpage_type and 
+                self.clickable_element.get_attribute('aria-expanded') == 'true'):
+                self.click()
+            return
+
         # For object-based, have to re-calculate options because the references
         # calculated previously have turned stale
         # Note: Chrome and Edge can encounter stale element references when 
@@ -457,20 +775,23 @@ class AxisMenu:
             self.click()                    # opens the menu
 
         # Select the given option
-        # TODO: is there a better way to do this than list comprehension?
-        option_to_click = [o for o in self.options if o.name == axis_name]
-        option_to_click[0].click()
+        try:
+            option_to_click = self._options_by_name[axis_name]
+        except KeyError:
+            raise ValueError(f"Axis name {axis_name} could not be found")
+        option_to_click.click()
+        self.record_selection(axis_name)
 
-    def calculate_all(driver, webpage_type):
+    def calculate_all(driver, webpage_type, wait: Optional[WebDriverWait] = None):
         """Calculate all AxisMenus for this webpage."""
         if webpage_type == 'object-whole':
-            menus = [AxisMenu(driver, webpage_type, i) for i in range(3)]
+            menus = [AxisMenu(driver, webpage_type, i, wait) for i in range(3)]
         elif webpage_type == 'link-whole':
-            menus = [AxisMenu(driver, webpage_type, i) for i in range(3)]
+            menus = [AxisMenu(driver, webpage_type, i, wait) for i in range(3)]
         elif webpage_type == 'object-broken':
-            menus = [AxisMenu(driver, webpage_type, i) for i in range(3)]        #TODO: add proper support for this
+            menus = [AxisMenu(driver, webpage_type, i, wait) for i in range(3)]        #TODO: add proper support for this
         elif webpage_type == 'link-broken':
-            menus = [AxisMenu(driver, webpage_type, i) for i in range(3)]        #TODO: add proper support for this
+            menus = [AxisMenu(driver, webpage_type, i, wait) for i in range(3)]        #TODO: add proper support for this
         return menus
     
     @property
@@ -484,10 +805,11 @@ class Option:
     
     Args:
         clickable_web_element: The clickable web element for this Option.
+        name: The name of this Option (the text of `clickable_web_element`).
     """
-    def __init__(self, clickable_web_element):
+    def __init__(self, clickable_web_element, name: str):
         self.clickable_element = clickable_web_element
-        self.name = clickable_web_element.text  #TODO: StaleElementReferenceException can get thrown here
+        self.name = name
     
     def click(self):
         self.clickable_element.click()
@@ -514,19 +836,57 @@ class CollationEngine():
                   visible window, so no graphical rendering is performed and no
                   manual interaction with the browser instance is possible.
                   Defaults to False.
+        workers: An integer representing the number of browser instances to
+                 use in parallel when collating data. Each instance collates a
+                 separate slice of the rows in table 1, and the main browser
+                 instance collates the first slice. Note that each instance 
+                 adds load on the TRAC servers. Defaults to 1.
     """
     def __init__(self, browser: SUPPORTED_BROWSERS, url: str, 
-                 filename: str | Path, axes: list[str], headless: bool=False):
+                 filename: str | Path, axes: list[str], headless: bool=False,
+                 workers: int=1):
         print("Initializing collation engine... ", end="")
 
         # Validate Input
-        self.validate_input(browser, url, filename, axes, headless)
+        self.validate_input(browser, url, filename, axes, headless, workers)
         
         # Set instance attributes
         self.browser = browser
-        self.driver = self.get_driver(browser, headless)
+        self.url = url
+        self.headless = headless
         self.filename = filename
         self.axes = axes
+        self.workers = workers
+
+        # Load progress saved by a previous, unfinished run
+        # Note: this is done before the browser is opened, so that checkpoints
+        #       from a run with a different URL or axes are rejected right away
+        checkpoint = self.load_checkpoints()
+        self.resumed_data, self.resumed_header, self.completed_t1_names = checkpoint
+        if self.resumed_header is not None:
+            self.check_checkpoint_header(self.resumed_header)
+
+        self.driver = self.get_driver(browser, headless)
+        try:
+            # Go to webpage and set axes
+            self.setup_webpage(url)
+
+            print("Done.")
+
+            # Dataset
+            self.create_dataset()
+            self.clean_dataset()
+            self.save_dataset()
+            self.remove_checkpoints()
+        finally:
+            # close browser
+            self.driver.quit()
+        print(f"Browser instance closed. Output file is saved at {filename}.")
+
+    def setup_webpage(self, url: str):
+        """
+        Go to the webpage, calculate its menus and tables, and set the axes.
+        """
         self.tables = [None, None, None]
 
         # Determine webpage type
@@ -535,9 +895,13 @@ class CollationEngine():
         # Go to webpage
         self.driver.get(url)
 
+        # Create a single WebDriverWait to be shared by all menus and tables
+        self.wait = WebDriverWait(self.driver, TIMEOUT)
+
         # Calculate Menus
         # TODO: this currently doesn't work for broken-out webpages
-        self.menus = AxisMenu.calculate_all(self.driver, self.webpage_type)
+        self.menus = AxisMenu.calculate_all(self.driver, self.webpage_type, 
+                                            self.wait)
 
         # Calculate tables
         # TODO: this currently doesn't work for broken-out webpages
@@ -545,34 +909,61 @@ class CollationEngine():
             table_type = 'object'
         elif self.webpage_type in ('link-whole', 'link-broken'):
             table_type = 'link'
-        self.tables = [Table(self.driver, i, table_type) for i in range(3)]
+        self.tables = [Table(self.driver, i, table_type, self.wait) 
+                       for i in range(3)]
 
         # Check for valid input axis names
         # Note: technically, all menus should have the same options, but this
         #       will not always be the case if support is added for more webpage
         #       types, so all menus will be checked
         for m in self.menus:
+            option_names = set(m.option_names)
             for a in self.axes:
-                if a not in m.option_names:
+                if a not in option_names:
                     raise ValueError(f"Axis name {a} could not be found")
 
         # Set Axes
-        for i, a in enumerate(self.axes):
-            self.menus[i].set_to(a)
+        # Note: link-whole menus are plain <select> elements, so they can all
+        #       be set at once. Object menus are Headless UI listboxes, which
+        #       need real click events.
+        if self.webpage_type == 'link-whole':
+            self._set_all_axes_js(self.axes)
+        else:
+            for i, a in enumerate(self.axes):
+                self.menus[i].set_to(a)
 
-        print("Done.")
+    def _set_all_axes_js(self, axes: list[str]):
+        """
+        Set the <select> element of every AxisMenu to the corresponding axis
+        in `axes` with a single call to `driver.execute_script`, then wait for
+        the tables of the changed axes to re-render.
 
-        # Dataset
-        self.create_dataset()
-        self.clean_dataset()
-        self.save_dataset()
-    
-        # close browser
-        self.driver.close()
-        print(f"Browser instance closed. Output file is saved at {filename}.")
+        Unlike clicking an option, the script does not wait for the webpage
+        to update, so without the wait the tables could be read before the
+        new axes are applied.
+        """
+        # Nothing to do if every menu is already set
+        changed = [i for i, (m, a) in enumerate(zip(self.menus, axes)) 
+                   if m.current != a]
+        if not changed:
+            return
+        
+        # Table i shows the values of axis i
+        for i in changed:
+            self.tables[i].watch_for_change()
+
+        missing_axes = self.driver.execute_script(SET_ALL_AXES_SCRIPT, axes)
+        if missing_axes:
+            raise ValueError(f"Axis name {missing_axes[0]} could not be found")
+        for m, a in zip(self.menus, axes):
+            m.record_selection(a)
+
+        for i in changed:
+            self.tables[i].wait_stable()
 
     def validate_input(self, browser: SUPPORTED_BROWSERS, url: str, 
-                       filename: str | Path, axes: list[str], headless: bool):
+                       filename: str | Path, axes: list[str], headless: bool,
+                       workers: int):
         """Check that input parameters are valid."""
         # Check for valid browser
         if browser not in get_args(SUPPORTED_BROWSERS):
@@ -581,7 +972,7 @@ class CollationEngine():
             raise TypeError(msg)
         
         # Check for valid filename type
-        if type(filename) not in (str, type(Path())):
+        if not isinstance(filename, (str, Path)):
             raise TypeError(f"filename must be of type str or Path")
 
         # Make path of output file absolute
@@ -590,22 +981,10 @@ class CollationEngine():
             filename = filename.resolve()
 
         # Check that we have permission to write the output file
-        testfilename = filename.parent / 'test.txt'
-        try:
-            testfile = open(testfilename, 'w')
-        except (OSError, IOError):
-            msg = f"Error: Cannot write a file to the folder {filename.parent}."
-            msg += "\nPlease enter a different value for `filename`."
-            print(msg)
-            quit()
-        else:
-            testfile.close()
-            try:
-                os.remove(testfilename)
-            except OSError:
-                msg = f"Warning: temporary file could not be deleted: {testfilename}"
-                msg += "\nPlease delete file manually after execution is complete."
-                print(msg)
+        if not os.access(filename.parent, os.W_OK):
+            msg = f"Cannot write a file to the folder {filename.parent}. "
+            msg += "Please enter a different value for `filename`."
+            raise PermissionError(msg)
         
         # Check for valid URL
         if WEBPAGE_TYPES[url] not in FULLY_SUPPORTED_TYPES:
@@ -620,6 +999,12 @@ class CollationEngine():
         if type(headless) != bool:
             raise TypeError("headless must be of type bool")
         
+        # Check for valid number of workers
+        if type(workers) != int:
+            raise TypeError("workers must be of type int")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        
 
     def get_driver(self, browser: SUPPORTED_BROWSERS, headless):
         """Import necessary classes and return webdriver for the chosen browser."""
@@ -629,6 +1014,12 @@ class CollationEngine():
             options = Options()
             if headless:
                 options.add_argument('--headless')
+            # Only text is read from the webpage, so return from page loads at
+            # DOMContentLoaded and skip loading images, media, and disk cache
+            options.page_load_strategy = 'eager'
+            options.set_preference('permissions.default.image', 2)
+            options.set_preference('media.autoplay.default', 5)
+            options.set_preference('browser.cache.disk.enable', False)
             return Firefox(options=options)
         
         elif browser == 'Chrome':
@@ -658,88 +1049,345 @@ class CollationEngine():
     def create_dataset(self):
         """
         Create a dataset of nested dictionaries from the webpage.
+
+        If more than one worker is requested, the rows of table 1 are split
+        into contiguous slices. The first slice is collated by this engine's
+        browser instance, and each other slice is collated in its own browser
+        instance (see `_scrape_t1_slice`).
+        """
+        # Check progress saved by a previous, unfinished run (see __init__)
+        t1_names = self.tables[0].row_names
+        resumed_data = self.resumed_data
+        completed_t1_names = self.completed_t1_names
+        if self.resumed_header is not None:
+            self.check_checkpoint_header(self.resumed_header, t1_names)
+            print("Resuming from checkpoint... ")
+
+        # Header written at the start of every checkpoint file of this run
+        self.checkpoint_header = {
+            'url': self.url, 'axes': list(self.axes), 't1_names': t1_names
+        }
+
+        # Split table 1 rows between workers
+        # Note: rows are passed by name, so each worker collates exactly the
+        #       rows it was given even if its webpage lists them differently
+        n_workers = min(self.workers, len(t1_names))
+
+        if n_workers <= 1:
+            data = self.collate_t1_rows(t1_names, 0, resumed_data, 
+                                        completed_t1_names)
+        else:
+            slice_size = -(-len(t1_names) // n_workers)   # ceiling division
+            t1_slices = [t1_names[i:i + slice_size] 
+                         for i in range(0, len(t1_names), slice_size)]
+            
+            # Slices are contiguous and results are merged in order, so the
+            # order of table 1 rows is preserved
+            with ProcessPoolExecutor(max_workers=len(t1_slices) - 1) as executor:
+                futures = {
+                    executor.submit(
+                        CollationEngine._scrape_t1_slice,
+                        self.browser, self.url, self.axes, self.headless, 
+                        self.filename, self.checkpoint_header, t1_slices[k], k, 
+                        resumed_data, completed_t1_names
+                    ): k
+                    for k in range(1, len(t1_slices))
+                }
+
+                # This engine's browser collates the first slice meanwhile
+                # Note: on an error, pending slices are cancelled and the error
+                #       is raised without waiting for the running workers to 
+                #       finish their slices (their progress is checkpointed)
+                try:
+                    slice_data = [None] * len(t1_slices)
+                    slice_data[0] = self.collate_t1_rows(
+                        t1_slices[0], 0, resumed_data, completed_t1_names
+                    )
+                    for future in as_completed(futures):
+                        slice_data[futures[future]] = future.result()
+                except BaseException:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+            
+            data = {}
+            for d in slice_data:
+                data.update(d)
+        
+        # Save data as attribute and convert to dataframe
+        # Note: values are written into a single preallocated array rather than
+        #       concatenating one dataframe per table 1 row. The index is the
+        #       full product of table 1 and table 2 names, so (table 1, table 2)
+        #       pairs that are missing from the webpage are filled with 0.
+        self.data = data
+        t1_names = [k1 for k1, v1 in data.items() if v1]
+        t2_names = list(dict.fromkeys(k2 for v1 in data.values() for k2 in v1))
+        columns = sorted({k3 for v1 in data.values() 
+                          for v2 in v1.values() for k3 in v2})
+        t2_positions = {k2: i for i, k2 in enumerate(t2_names)}
+        column_positions = {c: i for i, c in enumerate(columns)}
+        
+        values = np.zeros((len(t1_names) * len(t2_names), len(columns)), 
+                          dtype=np.int64)
+        for i, k1 in enumerate(t1_names):
+            for k2, v2 in data[k1].items():
+                row = i * len(t2_names) + t2_positions[k2]
+                for k3, v3 in v2.items():
+                    values[row, column_positions[k3]] = v3
+        
+        self.df = pd.DataFrame(
+            values, 
+            index=pd.MultiIndex.from_product([t1_names, t2_names]), 
+            columns=columns
+        )
+
+    def collate_t1_rows(self, t1_names: list[str], position: int = 0,
+                        resumed_data: Optional[dict] = None,
+                        completed_t1_names: Optional[set[str]] = None):
+        """
+        Collate the data for the table 1 rows named in `t1_names` into a
+        dictionary of nested dictionaries. `position` offsets the progress
+        bars so that multiple workers can display them at once.
+
+        Each collated (table 1, table 2) pair is appended to this worker's
+        checkpoint file as soon as it is read. Pairs that are already in
+        `resumed_data` are not collated again, and table 1 rows in
+        `completed_t1_names` are not even clicked.
         """
+        if resumed_data is None:
+            resumed_data = {}
+        if completed_t1_names is None:
+            completed_t1_names = set()
+        
         # Set progress bar formatting
         pbar_format = "{desc}{percentage:3.0f}%|{bar:30}| {n_fmt}/{total_fmt} [{rate_fmt}{postfix}]"
         
         # Initialize data container dictionary
         data = {}
 
-        # Iterate over table 1 rows
-        pbar1 = tqdm(self.tables[0].rows, leave=False, bar_format=pbar_format)
-        for i, t1_row in enumerate(pbar1):  #https://stackoverflow.com/a/45519268/15426433
-            pbar1.set_description(shorten(f"Table 1: {t1_row.name}"))
-
-            data[t1_row.name] = {}
-
-            t1_row.click()
-
-            # Re-calculate rows for table 2
-            # sleep needed to make sure recalculation happens properly on Chrome and Edge
-            if self.browser in ['Chrome', 'Edge']:
-                sleep(0.1)
-            self.tables[1].recalculate_text_rows()
-            self.tables[1].recalculate_rows()
+        # Iterate over table 1 rows, appending each collated pair to this
+        # worker's checkpoint file (line-buffered, so every line is flushed)
+        with open(self.checkpoint_path(position), 'a', buffering=1) as checkpoint:
+            if checkpoint.tell() == 0:
+                self.write_checkpoint_header(checkpoint)
+
+            t1_rows_by_name = {r.name: r for r in self.tables[0].rows}
+            missing_names = [n for n in t1_names if n not in t1_rows_by_name]
+            if missing_names:
+                msg = "Table 1 rows could not be found on the webpage: "
+                msg += ', '.join(missing_names)
+                raise ValueError(msg)
+            t1_rows = [t1_rows_by_name[n] for n in t1_names]
+            pbar1 = tqdm(t1_rows, leave=False, bar_format=pbar_format, 
+                         position=2*position)
+            for i, t1_row in enumerate(pbar1):  #https://stackoverflow.com/a/45519268/15426433
+                pbar1.set_description(shorten(f"Table 1: {t1_row.name}"))
+
+                # Skip rows that were completely collated in a previous run
+                if t1_row.name in completed_t1_names:
+                    data[t1_row.name] = resumed_data[t1_row.name]
+                    continue
+
+                data[t1_row.name] = {}
+
+                self.tables[1].watch_for_change()
+                t1_row.click()
+
+                # Re-calculate rows for table 2 once it has re-rendered
+                self.tables[1].wait_stable()
+                self.tables[1].recalculate_rows()
             
-            # Iterate over table 2 rows
-            pbar2 = tqdm(self.tables[1].rows, leave=False, bar_format=pbar_format)
-            for j, t2_row in enumerate(pbar2):
-                pbar2.set_description(shorten(f"Table 2: {t2_row.name}"))  
+                # Iterate over table 2 rows
+                pbar2 = tqdm(self.tables[1].rows, leave=False, bar_format=pbar_format,
+                             position=2*position + 1)
+                for j, t2_row in enumerate(pbar2):
+                    pbar2.set_description(shorten(f"Table 2: {t2_row.name}"))  
+
+                    # Skip rows that were collated in a previous run
+                    resumed_t2_data = resumed_data.get(t1_row.name, {})
+                    if t2_row.name in resumed_t2_data:
+                        data[t1_row.name][t2_row.name] = resumed_t2_data[t2_row.name]
+                        continue
             
-                t2_row.click()
-
-                # Re-calculate rows for table 3
-                # sleep needed to make sure recalculation happens properly on Chrome and Edge
-                if self.browser in ['Chrome', 'Edge']:
-                    sleep(0.1)
-                self.tables[2].recalculate_text_rows()
-                self.tables[2].recalculate_rows()
-
-                # Copy rows from table 3 into the data dictionary
-                t3_rows = self.tables[2].text_rows
-                t3_rows = [r.rsplit(' ', 1) for r in t3_rows]
-                t3_rows = [[r[0], int(r[1].replace(',', ''))] for r in t3_rows]
-                data[t1_row.name][t2_row.name] = {r[0]: r[1] for r in t3_rows}
+                    self.tables[2].watch_for_change()
+                    t2_row.click()
+
+                    # Re-calculate rows for table 3 once it has re-rendered
+                    # Note: only the text of table 3 is needed, so its rows are not
+                    #       calculated
+                    self.tables[2].wait_stable()
+                    self.tables[2].recalculate_text_rows()
+
+                    # Copy rows from table 3 into the data dictionary
+                    data[t1_row.name][t2_row.name] = dict(zip(
+                        self.tables[2].row_names, 
+                        self.tables[2].row_values.tolist()
+                    ))
+
+                    # Save progress
+                    checkpoint.write(json.dumps({
+                        't1': t1_row.name, 
+                        't2': t2_row.name, 
+                        't3': data[t1_row.name][t2_row.name]
+                    }) + '\n')
+
+                # Mark this table 1 row as complete
+                checkpoint.write(json.dumps({
+                    't1': t1_row.name, 
+                    'complete': True
+                }) + '\n')
         
-        # Save data as attribute and convert to dataframe
-        self.data = data
-        self.df = pd.concat(                # https://stackoverflow.com/a/54300940
-            {k: pd.DataFrame(v).T for k, v in data.items()}, 
-            axis=0
-        )
+        return data
+
+    def checkpoint_path(self, position: int = 0):
+        """Path of the checkpoint file written by the worker at `position`."""
+        filename = Path(self.filename)
+        return filename.parent / f"{filename.stem}.checkpoint{position}.jsonl"
+    
+    def checkpoint_paths(self):
+        """List of paths of all existing checkpoint files for this dataset."""
+        filename = Path(self.filename)
+        return sorted(filename.parent.glob(f"{filename.stem}.checkpoint*.jsonl"))
+
+    def load_checkpoints(self):
+        """
+        Load the checkpoint files of a previous, unfinished run.
+
+        Every checkpoint file must start with the same header, so that records
+        from different runs can never be mixed. Raises ValueError otherwise.
+
+        Returns: a tuple of the saved data as a dictionary of nested 
+                 dictionaries, the header of the run (a dictionary of its URL,
+                 axes, and table 1 row names, or None if there are no 
+                 checkpoint records), and the set of table 1 row names that 
+                 were completely collated.
+        """
+        data = {}
+        header = None
+        completed_t1_names = set()
+        for path in self.checkpoint_paths():
+            file_header = None
+            with open(path) as f:
+                for line in f:
+                    # The last line may be incomplete if the run was killed
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    
+                    # The first record of each file is its header
+                    if file_header is None:
+                        if 't1_names' not in record:
+                            msg = f"The checkpoint file {path} has no header. "
+                            msg += "Please delete it to start over."
+                            raise ValueError(msg)
+                        file_header = record
+                        if header is None:
+                            header = record
+                        elif record != header:
+                            msg = "The checkpoint files were saved by different "
+                            msg += "runs. Please delete them to start over: "
+                            msg += ', '.join(str(p) for p in self.checkpoint_paths())
+                            raise ValueError(msg)
+                    elif 'complete' in record:
+                        completed_t1_names.add(record['t1'])
+                        data.setdefault(record['t1'], {})
+                    else:
+                        data.setdefault(record['t1'], {})[record['t2']] = record['t3']
+        return data, header, completed_t1_names
+
+    def write_checkpoint_header(self, checkpoint):
+        """
+        Start a new checkpoint file by saving the URL, the axes, and the names
+        of the table 1 rows, which are used to check that the checkpoint 
+        belongs to this run (and that the webpage has not changed) when 
+        resuming.
+        """
+        checkpoint.write(json.dumps(self.checkpoint_header) + '\n')
+
+    def check_checkpoint_header(self, header: dict, 
+                                t1_names: Optional[list[str]] = None):
+        """
+        Raise ValueError if a checkpoint header was saved by a run with a 
+        different URL or axes, or (if `t1_names` is given) when table 1 had
+        different rows. Resuming from such a checkpoint would mix unrelated
+        data into the dataset.
+        """
+        if header.get('url') != self.url or header.get('axes') != list(self.axes):
+            reason = "was saved for a different URL or different axes"
+        elif t1_names is not None and header.get('t1_names') != t1_names:
+            reason = "was saved when table 1 had different rows"
+        else:
+            return
+        msg = f"The checkpoint {reason}. "
+        msg += "Please delete the checkpoint files to start over: "
+        msg += ', '.join(str(p) for p in self.checkpoint_paths())
+        raise ValueError(msg)
+
+    def remove_checkpoints(self):
+        """Remove all checkpoint files for this dataset."""
+        for path in self.checkpoint_paths():
+            os.remove(path)
+
+    @staticmethod
+    def _scrape_t1_slice(browser: SUPPORTED_BROWSERS, url: str, 
+                         axes: list[str], headless: bool, 
+                         filename: str | Path, checkpoint_header: dict,
+                         t1_names: list[str], 
+                         position: int = 0, resumed_data: Optional[dict] = None,
+                         completed_t1_names: Optional[set[str]] = None):
+        """
+        Collate the table 1 rows named in `t1_names` in a new browser instance.
+        This is the worker function used by `create_dataset` for parallel
+        collation, so all of its arguments must be picklable.
+        """
+        # __init__ is bypassed because it would collate the whole webpage
+        engine = CollationEngine.__new__(CollationEngine)
+        engine.browser = browser
+        engine.axes = axes
+        engine.filename = filename
+        engine.checkpoint_header = checkpoint_header
+        engine.driver = engine.get_driver(browser, headless)
+        try:
+            engine.setup_webpage(url)
+            return engine.collate_t1_rows(t1_names, position, resumed_data,
+                                          completed_t1_names)
+        finally:
+            engine.driver.quit()
 
     def clean_dataset(self):
         """Clean the raw collated dataset to ensure clarity and completeness."""
-        # Rectify missing second-level index entries
-        unique_index1 = self.df.index.unique(0)
-        unique_index2 = self.df.index.unique(1)
-        new_index = pd.MultiIndex.from_product([unique_index1, unique_index2])
-        self.df = self.df.reindex(new_index, axis='index')
-
-        # Change all NaN values to 0
-        self.df = self.df.fillna(value=0.0)
+        # Note: missing second-level index entries are already rectified (and
+        #       filled with 0) by create_dataset
 
         # Sort df rows
         self.df = self.df.sort_index()
 
         # Sort df columns
-        self.df = self.df.reindex(sorted(self.df.columns), axis=1)
+        self.df = self.df.sort_index(axis=1)
 
         # Add a Total Column
         self.df['Total'] = self.df.sum(axis=1)
 
         # Convert all floats to int (cannot have fractions of people)
-        float_cols = self.df.select_dtypes(include=['float64'])
-        for col in float_cols.columns.values:
-            self.df[col] = self.df[col].astype('int64')
+        # Note: converting all columns in one call avoids a copy per column
+        float_cols = self.df.select_dtypes(include=['float64']).columns
+        self.df = self.df.astype({c: 'int64' for c in float_cols})
 
         # Rename indices to reflect axis names
         for i, a in enumerate(self.axes[:-1]):
             self.df.index.rename(names=a, level=i, inplace=True)     
             
     def save_dataset(self):
-        """Save the collated dataset as an HDF file."""
-        self.df.to_hdf(self.filename, key='TRACDataset')
+        """
+        Save the collated dataset as a compressed HDF file in table format, 
+        which can be queried by its index levels with 
+        `pd.read_hdf(..., where=...)`.
+        """
+        # Note: the columns are not saved as data columns, since their names 
+        #       come from TRAC labels and may not be valid PyTables names 
+        #       (e.g., "Unknown/Not Reported")
+        self.df.to_hdf(self.filename, key='TRACDataset', format='table',
+                       complib='blosc:zstd', complevel=3)
 
 def shorten(text, 
             text_limit=24, 
@@ -769,11 +1417,13 @@ if __name__ == '__main__':
             print(USAGE)
         
         # Options-only
-        elif 1 < len(sys.argv) < 4:
+        elif 1 < len(sys.argv) < 5:
             browser = [i for i in sys.argv if "browser" in i][0].replace(
                 "--browser=", ""
             )
             headless = len([i for i in sys.argv if "headless" in i]) > 0
+            workers = [i for i in sys.argv if i.startswith("--workers=")]
+            workers = int(workers[0].replace("--workers=", "")) if workers else 1
             url = input("Please enter the URL of the TRAC webpage: ")
             file = input("Please enter the name or path of the output file: ")
             axes = input(
@@ -781,19 +1431,23 @@ if __name__ == '__main__':
             ).split(',')
             
             engine = CollationEngine(browser=browser, url=url, filename=file,
-                                     axes=axes, headless=headless)
+                                     axes=axes, headless=headless, 
+                                     workers=workers)
         # Options and arguments
-        elif 4 < len(sys.argv) < 7 :
+        elif 4 < len(sys.argv) < 8:
             browser = [i for i in sys.argv if "browser" in i][0].replace(
                 "--browser=", ""
             )
             headless = len([i for i in sys.argv if "headless" in i]) > 0
+            workers = [i for i in sys.argv if i.startswith("--workers=")]
+            workers = int(workers[0].replace("--workers=", "")) if workers else 1
             url = sys.argv[-3]
             file = sys.argv[-2]
             axes = sys.argv[-1].split(',')
             
             engine = CollationEngine(browser=browser, url=url, filename=file,
-                                     axes=axes, headless=headless)
+                                     axes=axes, headless=headless, 
+                                     workers=workers)
         
         # All other situations are incorrect usage
         else: